@@ -18,6 +18,7 @@ from datetime import datetime
 import json
 import os
 import config
+import factory_index
 
 
 def format_value_for_display(value: float, gas: str) -> str:
@@ -220,23 +221,15 @@ class PollutionAnalyzer:
         Returns:
             List of nearby factories with distances
         """
-        factories = config.FACTORIES.get(city, [])
-        nearby = []
-        
-        for factory in factories:
-            distance = self._haversine_distance(
-                hotspot['lat'], hotspot['lon'],
-                factory['location'][0], factory['location'][1]
-            )
-            
-            if distance <= max_distance_km:
-                nearby.append({
-                    **factory,
-                    'distance_km': distance
-                })
-        
-        # Sort by distance
-        nearby.sort(key=lambda f: f['distance_km'])
+        matches = factory_index.nearby(
+            float(hotspot['lat']), float(hotspot['lon']), float(max_distance_km), city
+        )
+
+        # Already sorted by distance
+        nearby = [
+            {**factory_index.FACTORY_ENTRIES[i][1].to_dict(), 'distance_km': distance}
+            for i, distance in matches
+        ]
         
         logger.info(f"Found {len(nearby)} factories within {max_distance_km}km of hotspot")
         return nearby
@@ -1004,21 +997,6 @@ Use the visual map to provide insights beyond the numerical data."""
                 return f"خطأ في التحليل. يرجى المحاولة مرة أخرى."
             return f"Error in analysis. Please try again."
 
-    @staticmethod
-    def _haversine_distance(lat1: float, lon1: float,
-                           lat2: float, lon2: float) -> float:
-        """Calculate distance between two points on Earth (km)"""
-        R = 6371  # Earth radius in km
-        
-        lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        
-        a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
-        c = 2 * np.arcsin(np.sqrt(a))
-        
-        return R * c
-    
     @staticmethod
     def _calculate_bearing(lat1: float, lon1: float,
                           lat2: float, lon2: float) -> float:
@@ -16,6 +16,7 @@ import numpy as np
 from typing import Dict, List, Optional
 from datetime import datetime
 from collections import defaultdict
+from bisect import bisect_right
 import logging
 import pytz
 import config
@@ -46,6 +47,13 @@ class CityBenchmarkAnalyzer:
         'heavily_polluted': {'min': 120, 'max': float('inf'), 'label_en': 'Heavily Polluted', 'label_ar': 'ملوث بشدة', 'color': '#dc2626'},
     }
 
+    # Category lower bounds in ascending order, for a single bisect per score
+    _CATEGORY_NAMES = tuple(RANK_CATEGORIES)
+    _CATEGORY_MINS = tuple(cat['min'] for cat in RANK_CATEGORIES.values())
+
+    # Confidence indexed by number of available data sources (live, history)
+    _CONFIDENCE_LEVELS = ('low', 'medium', 'high')
+
     def __init__(self, violation_recorder=None):
         """Initialize with Firestore access."""
         self.cities = list(config.CITIES.keys())
@@ -177,7 +185,7 @@ class CityBenchmarkAnalyzer:
 
             # Average exceedance (how much over threshold)
             exceedances = [v.get('percentage_over', 0) for v in historical_violations if v.get('percentage_over')]
-            avg_exceedance = np.mean(exceedances) if exceedances else 0
+            avg_exceedance = (sum(exceedances) / len(exceedances)) if exceedances else 0
 
             # Historical score: violations + exceedance bonus
             # Capped at 50 to prevent dominating live score
@@ -196,22 +204,14 @@ class CityBenchmarkAnalyzer:
             # No data at all - neutral score
             composite = 50  # Middle of the road
 
-        # Determine category
-        category = 'heavily_polluted'
-        for cat_name, cat_info in self.RANK_CATEGORIES.items():
-            if cat_info['min'] <= composite < cat_info['max']:
-                category = cat_name
-                break
+        # Determine category (categories are contiguous, so bisect on lower bounds)
+        idx = bisect_right(self._CATEGORY_MINS, composite) - 1
+        category = self._CATEGORY_NAMES[idx] if idx >= 0 else 'heavily_polluted'
 
         # Confidence level
         has_live = data_quality > 0.5
         has_history = len(historical_violations) >= 3
-        if has_live and has_history:
-            confidence = 'high'
-        elif has_live or has_history:
-            confidence = 'medium'
-        else:
-            confidence = 'low'
+        confidence = self._CONFIDENCE_LEVELS[int(has_live) + int(has_history)]
 
         return {
             'city': city,
@@ -16,7 +16,20 @@ Standards:
 """
 
 import os
+import re
+import sys
+import json
+import mmap
+from collections.abc import Mapping
 from datetime import datetime
+from functools import lru_cache
+from typing import Dict, NamedTuple, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 
 # =============================================================================
@@ -289,1257 +302,225 @@ GAS_THRESHOLDS = {
 # INDUSTRIAL FACILITY DATABASE
 # Verified locations of major industrial facilities for source attribution
 # Covers all major industrial cities in Saudi Arabia
+#
+# Stored in factories.jsonl, one facility per line with "city" as the first key
+# and rows grouped by city. A city's rows are only parsed on first access, with
+# orjson when it is installed.
 # =============================================================================
-FACTORIES = {
-    # =========================================================================
-    # WESTERN REGION
-    # =========================================================================
-    "Yanbu": [
-        {
-            "name": "Yanbu Aramco Sinopec Refining Company (YASREF)",
-            "location": [23.97180767441081, 38.27666340484693],
-            "type": "Oil Refinery",
-            "emissions": ["NO2", "SO2", "CO", "CH4", "HCHO"],
-            "capacity": "400,000 bpd",
-            "source": "Saudi Aramco / Sinopec JV",
-            "verified": True
-        },
-        {
-            "name": "Yanbu National Petrochemical Company (Yansab)",
-            "location": [23.98755566320477, 38.26118777754422],
-            "type": "Petrochemical",
-            "emissions": ["NO2", "SO2", "CO", "HCHO", "CH4"],
-            "capacity": "Ethylene, polyethylene, polypropylene",
-            "source": "SABIC 51% owned",
-            "verified": True
-        },
-        {
-            "name": "Saudi Aramco Mobil Refinery Company (SAMREF)",
-            "location": [23.98170815715227, 38.23998762712382],
-            "type": "Oil Refinery",
-            "emissions": ["NO2", "SO2", "CO", "CH4", "HCHO"],
-            "capacity": "Oil refinery operations",
-            "source": "Saudi Aramco / ExxonMobil JV",
-            "verified": True
-        },
-        {
-            "name": "National Industrial Gaseous Company - GAS - SABIC Affiliate",
-            "location": [23.99145021834566, 38.233966223430244],
-            "type": "Industrial Gases",
-            "emissions": ["NO2", "CO", "CH4"],
-            "capacity": "Industrial gas production",
-            "source": "SABIC Affiliate",
-            "verified": True
-        },
-        {
-            "name": "Farabi Yanbu Petrochemicals",
-            "location": [23.997065895150783, 38.245319078310835],
-            "type": "Petrochemical",
-            "emissions": ["NO2", "SO2", "CO", "HCHO", "CH4"],
-            "capacity": "Petrochemical production",
-            "source": "Farabi Petrochemicals",
-            "verified": True
-        },
-        {
-            "name": "WangKang Ceramic Factory",
-            "location": [23.99454460117585, 38.27172544242537],
-            "type": "Ceramic Manufacturing",
-            "emissions": ["NO2", "SO2"],
-            "capacity": "Ceramic production",
-            "source": "WangKang Industrial",
-            "verified": True
-        },
-        {
-            "name": "KEMYEA YANBU FOR INDUSTRY LLC (KEMYAN)",
-            "location": [23.991679434439412, 38.279816703638616],
-            "type": "Chemical/Industrial",
-            "emissions": ["NO2", "SO2", "CO", "HCHO", "CH4"],
-            "capacity": "Chemical manufacturing",
-            "source": "Kemyan Industrial",
-            "verified": True
-        },
-        {
-            "name": "Elkhayyat Ceramic Factory",
-            "location": [24.000389343563565, 38.278436798625506],
-            "type": "Ceramic Manufacturing",
-            "emissions": ["NO2", "SO2"],
-            "capacity": "Ceramic production",
-            "source": "Elkhayyat Industrial",
-            "verified": True
-        },
-        {
-            "name": "Saudi Aramco - Yanbu Refinery",
-            "location": [23.958214308995846, 38.2922050960996],
-            "type": "Oil Refinery",
-            "emissions": ["NO2", "SO2", "CO", "CH4", "HCHO"],
-            "capacity": "Oil refinery operations",
-            "source": "Saudi Aramco",
-            "verified": True
-        },
-        {
-            "name": "LUBEREF (Saudi Aramco Base Oil Company)",
-            "location": [23.94280933497991, 38.31558992864651],
-            "type": "Lubricant Manufacturing",
-            "emissions": ["NO2", "SO2", "CO", "HCHO", "CH4"],
-            "capacity": "Base oil production",
-            "source": "Saudi Aramco subsidiary",
-            "verified": True
-        },
-        {
-            "name": "Yamamah Steel Plant",
-            "location": [23.929242832773316, 38.337334853848496],
-            "type": "Steel Manufacturing",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Steel production",
-            "source": "Yamamah Industrial",
-            "verified": True
-        },
-        {
-            "name": "REVIVA GEMS - IWMC YANBU",
-            "location": [23.936437388058888, 38.34763377503578],
-            "type": "Industrial Waste Management",
-            "emissions": ["NO2", "CO", "CH4"],
-            "capacity": "Waste management facility",
-            "source": "Reviva Environmental",
-            "verified": True
-        },
-        {
-            "name": "Saline Water Conversion Corporation Yanbu Medina",
-            "location": [23.854613250074483, 38.386043774124936],
-            "type": "Desalination/Power",
-            "emissions": ["NO2", "SO2", "CO", "CH4"],
-            "capacity": "Desalination and power generation",
-            "source": "SWCC",
-            "verified": True
-        },
-        {
-            "name": "ASK GYPSUM",
-            "location": [24.00966677237242, 38.26981308872577],
-            "type": "Gypsum Manufacturing",
-            "emissions": ["NO2", "SO2"],
-            "capacity": "Gypsum production",
-            "source": "ASK Industrial",
-            "verified": True
-        },
-        {
-            "name": "Lubrizol",
-            "location": [23.957106616346582, 38.23656228492223],
-            "type": "Chemical Manufacturing",
-            "emissions": ["NO2", "SO2", "CO", "HCHO", "CH4"],
-            "capacity": "Specialty chemicals",
-            "source": "Lubrizol Corporation",
-            "verified": True
-        },
-        {
-            "name": "Marafiq IWTP & SWTP",
-            "location": [23.970008910654663, 38.22397924555842],
-            "type": "Water Treatment Plant",
-            "emissions": ["NO2", "CO"],
-            "capacity": "Industrial water treatment",
-            "source": "Marafiq Utilities",
-            "verified": True
-        },
-        {
-            "name": "MARAFIQ (The Power and Utility company for Jubail & Yanbu)",
-            "location": [23.905797209940143, 38.323333590205266],
-            "type": "Power/Desalination",
-            "emissions": ["NO2", "SO2", "CO", "CH4"],
-            "capacity": "2,750 MW + desalination",
-            "source": "Marafiq - Main utility provider",
-            "verified": True
-        },
-    ],
-
-    "Jeddah": [
-        {
-            "name": "Saudi Aramco Jeddah Refinery",
-            "location": [21.4221, 39.1567],
-            "type": "Oil Refinery",
-            "emissions": ["NO2", "SO2", "CO", "CH4", "HCHO"],
-            "capacity": "100,000 bpd",
-            "source": "Saudi Aramco",
-            "verified": True
-        },
-        {
-            "name": "Jeddah Islamic Port Industrial Zone",
-            "location": [21.4833, 39.1667],
-            "type": "Port / Logistics",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Major container port operations",
-            "source": "Saudi Ports Authority",
-            "verified": True
-        },
-        {
-            "name": "SABIC Jeddah Plastics Application Development Center",
-            "location": [21.5489, 39.1833],
-            "type": "Plastics/Chemical",
-            "emissions": ["NO2", "CO", "HCHO"],
-            "capacity": "R&D and manufacturing",
-            "source": "SABIC",
-            "verified": True
-        },
-        {
-            "name": "Jeddah Steel Rolling Mill",
-            "location": [21.4556, 39.1444],
-            "type": "Steel Manufacturing",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Steel rolling operations",
-            "source": "Rajhi Steel",
-            "verified": True
-        },
-        {
-            "name": "Saudi Cement Company - Jeddah",
-            "location": [21.5111, 39.2333],
-            "type": "Cement",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Cement production",
-            "source": "Saudi Cement Co.",
-            "verified": True
-        },
-        {
-            "name": "Jeddah Oil Storage Facility",
-            "location": [21.4389, 39.1722],
-            "type": "Oil Storage",
-            "emissions": ["NO2", "CH4", "HCHO"],
-            "capacity": "Strategic oil storage",
-            "source": "Saudi Aramco",
-            "verified": True
-        },
-        {
-            "name": "Shoaiba Power Plant",
-            "location": [20.6833, 39.5167],
-            "type": "Power Generation",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "5,600 MW",
-            "source": "SEC / ACWA Power",
-            "verified": True
-        },
-        {
-            "name": "Shoaiba Desalination Plant",
-            "location": [20.6722, 39.5056],
-            "type": "Desalination",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "1.5 million m³/day",
-            "source": "SWCC",
-            "verified": True
-        },
-        {
-            "name": "Jeddah Industrial City Phase 1",
-            "location": [21.5667, 39.1833],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO", "HCHO"],
-            "capacity": "Multiple manufacturing facilities",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "National Prawn Company",
-            "location": [21.3000, 39.1167],
-            "type": "Aquaculture/Processing",
-            "emissions": ["NO2", "CH4"],
-            "capacity": "Seafood processing",
-            "source": "NPC",
-            "verified": True
-        }
-    ],
-
-    "Makkah": [
-        {
-            "name": "Makkah Central Slaughterhouse",
-            "location": [21.4267, 39.8267],
-            "type": "Food Processing",
-            "emissions": ["NO2", "CH4"],
-            "capacity": "Large-scale meat processing",
-            "source": "Makkah Municipality",
-            "verified": True
-        },
-        {
-            "name": "Zamzam Water Bottling Plant",
-            "location": [21.4222, 39.8278],
-            "type": "Water Bottling",
-            "emissions": ["NO2", "CO"],
-            "capacity": "Zamzam water processing",
-            "source": "Zamzam Studies Institute",
-            "verified": True
-        },
-        {
-            "name": "Makkah Industrial City",
-            "location": [21.3556, 39.9444],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Light manufacturing",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "Al-Khadra Recycling Facility",
-            "location": [21.3889, 39.8556],
-            "type": "Waste Management",
-            "emissions": ["NO2", "CH4", "CO"],
-            "capacity": "Recycling and waste processing",
-            "source": "Makkah Municipality",
-            "verified": True
-        }
-    ],
-
-    "Madinah": [
-        {
-            "name": "Madinah Industrial City",
-            "location": [24.4667, 39.6167],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO", "HCHO"],
-            "capacity": "Light to medium manufacturing",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "Saudi Dates Factory",
-            "location": [24.4889, 39.5778],
-            "type": "Food Processing",
-            "emissions": ["NO2", "CH4"],
-            "capacity": "Date processing and packaging",
-            "source": "Saudi Date Company",
-            "verified": True
-        },
-        {
-            "name": "Madinah Printing & Publishing Complex",
-            "location": [24.5111, 39.5889],
-            "type": "Printing/Publishing",
-            "emissions": ["NO2", "HCHO"],
-            "capacity": "Quran printing complex",
-            "source": "King Fahd Complex",
-            "verified": True
-        },
-        {
-            "name": "Yanbu-Madinah Pipeline Terminal",
-            "location": [24.5333, 39.5500],
-            "type": "Oil/Gas Terminal",
-            "emissions": ["NO2", "CH4", "HCHO"],
-            "capacity": "Pipeline operations",
-            "source": "Saudi Aramco",
-            "verified": True
-        }
-    ],
-
-    "Rabigh": [
-        {
-            "name": "Petro Rabigh (Saudi Aramco/Sumitomo)",
-            "location": [22.7583, 39.0250],
-            "type": "Petrochemical/Refinery",
-            "emissions": ["NO2", "SO2", "CO", "HCHO", "CH4"],
-            "capacity": "400,000 bpd refinery + petrochemical",
-            "source": "Saudi Aramco / Sumitomo JV",
-            "verified": True
-        },
-        {
-            "name": "Rabigh Refining and Petrochemical (Phase 2)",
-            "location": [22.7667, 39.0333],
-            "type": "Petrochemical",
-            "emissions": ["NO2", "SO2", "CO", "HCHO", "CH4"],
-            "capacity": "Ethylene, propylene production",
-            "source": "Petro Rabigh",
-            "verified": True
-        },
-        {
-            "name": "Rabigh Power Plant",
-            "location": [22.7444, 39.0167],
-            "type": "Power Generation",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "1,200 MW",
-            "source": "SEC",
-            "verified": True
-        },
-        {
-            "name": "King Abdullah Economic City (KAEC) Industrial Valley",
-            "location": [22.4167, 39.1333],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO", "HCHO"],
-            "capacity": "Multiple industries",
-            "source": "Emaar Economic City",
-            "verified": True
-        },
-        {
-            "name": "Rabigh Cement Factory",
-            "location": [22.7889, 39.0444],
-            "type": "Cement",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Cement production",
-            "source": "Arabian Cement",
-            "verified": True
-        }
-    ],
-
-    # =========================================================================
-    # EASTERN REGION
-    # =========================================================================
-    "Jubail": [
-        {
-            "name": "SABIC Petrochemicals Complex (Jubail)",
-            "location": [27.0456, 49.5867],
-            "type": "Petrochemical",
-            "emissions": ["NO2", "SO2", "CO", "HCHO", "CH4"],
-            "capacity": "Multiple facilities",
-            "source": "SABIC - Jubail Industrial City",
-            "verified": True
-        },
-        {
-            "name": "Saudi Aramco Jubail Refinery (SATORP)",
-            "location": [27.0069, 49.6589],
-            "type": "Oil Refinery",
-            "emissions": ["NO2", "SO2", "CO", "CH4", "HCHO"],
-            "capacity": "400,000 bpd",
-            "source": "Saudi Aramco / Total JV",
-            "verified": True
-        },
-        {
-            "name": "KEMYA (Saudi Methanol Company)",
-            "location": [27.0567, 49.5734],
-            "type": "Methanol",
-            "emissions": ["NO2", "CO", "CH4", "HCHO"],
-            "capacity": "Methanol production",
-            "source": "SABIC / Celanese JV",
-            "verified": True
-        },
-        {
-            "name": "Saudi Iron & Steel Company (Hadeed)",
-            "location": [27.0289, 49.6201],
-            "type": "Steel",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "6 million tons/year",
-            "source": "SABIC subsidiary",
-            "verified": True
-        },
-        {
-            "name": "Ma'aden Phosphate Company (Jubail)",
-            "location": [27.0623, 49.5923],
-            "type": "Fertilizer",
-            "emissions": ["NO2", "SO2"],
-            "capacity": "Phosphate fertilizer",
-            "source": "Ma'aden / SABIC JV",
-            "verified": True
-        },
-        {
-            "name": "Air Products Industrial Gases Hub",
-            "location": [27.0512, 49.6123],
-            "type": "Industrial Gases",
-            "emissions": ["NO2", "CO", "CH4"],
-            "capacity": "World's largest hydrogen plant",
-            "source": "Air Products",
-            "verified": True
-        },
-        {
-            "name": "Saudi Kayan Petrochemical Company",
-            "location": [27.0428, 49.5978],
-            "type": "Petrochemical",
-            "emissions": ["NO2", "SO2", "CO", "HCHO", "CH4"],
-            "capacity": "Integrated petrochemical complex",
-            "source": "Saudi Kayan (SABIC affiliate)",
-            "verified": True
-        },
-        {
-            "name": "SAFCO (Saudi Arabian Fertilizer Company)",
-            "location": [27.0333, 49.6000],
-            "type": "Fertilizer",
-            "emissions": ["NO2", "SO2", "CH4"],
-            "capacity": "Urea and ammonia production",
-            "source": "SABIC subsidiary",
-            "verified": True
-        },
-        {
-            "name": "Marafiq Jubail Power Plant",
-            "location": [27.0167, 49.6333],
-            "type": "Power/Desalination",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "2,750 MW + desalination",
-            "source": "Marafiq",
-            "verified": True
-        },
-        {
-            "name": "Jubail United Petrochemical Company (JUPC)",
-            "location": [27.0500, 49.5833],
-            "type": "Petrochemical",
-            "emissions": ["NO2", "SO2", "CO", "HCHO", "CH4"],
-            "capacity": "Polyethylene production",
-            "source": "Tasnee",
-            "verified": True
-        },
-        {
-            "name": "Saudi Basic Industries Corp - Innovation Center",
-            "location": [27.0389, 49.5944],
-            "type": "R&D/Petrochemical",
-            "emissions": ["NO2", "CO", "HCHO"],
-            "capacity": "Research and development",
-            "source": "SABIC",
-            "verified": True
-        },
-        {
-            "name": "National Chemical Carriers Terminal",
-            "location": [27.0056, 49.6778],
-            "type": "Port / Chemical Terminal",
-            "emissions": ["NO2", "HCHO", "CH4"],
-            "capacity": "Chemical shipping terminal",
-            "source": "NCC / Vela International",
-            "verified": True
-        }
-    ],
-
-    "Dammam": [
-        {
-            "name": "Dammam 1st Industrial City",
-            "location": [26.4333, 50.0667],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO", "HCHO"],
-            "capacity": "Large industrial complex",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "Dammam 2nd Industrial City",
-            "location": [26.4556, 50.1222],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO", "HCHO"],
-            "capacity": "Large industrial complex",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "King Abdulaziz Port (Dammam Port)",
-            "location": [26.4611, 50.1889],
-            "type": "Port / Logistics",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Major cargo port",
-            "source": "Saudi Ports Authority",
-            "verified": True
-        },
-        {
-            "name": "Saudi Aramco Dammam Area Facilities",
-            "location": [26.4000, 50.0833],
-            "type": "Oil/Gas Operations",
-            "emissions": ["NO2", "SO2", "CO", "CH4"],
-            "capacity": "Oil and gas operations",
-            "source": "Saudi Aramco",
-            "verified": True
-        },
-        {
-            "name": "Dammam Cement Factory",
-            "location": [26.4889, 50.0556],
-            "type": "Cement",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Cement production",
-            "source": "Saudi Cement Company",
-            "verified": True
-        },
-        {
-            "name": "Eastern Province Electricity Company",
-            "location": [26.4167, 50.0944],
-            "type": "Power Generation",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Power distribution hub",
-            "source": "SEC",
-            "verified": True
-        }
-    ],
-
-    "Dhahran": [
-        {
-            "name": "Saudi Aramco Headquarters Complex",
-            "location": [26.2833, 50.1333],
-            "type": "Oil/Gas Operations",
-            "emissions": ["NO2", "CO", "CH4"],
-            "capacity": "Main operations center",
-            "source": "Saudi Aramco",
-            "verified": True
-        },
-        {
-            "name": "Dhahran Techno Valley",
-            "location": [26.2389, 50.0722],
-            "type": "Technology/R&D",
-            "emissions": ["NO2", "CO"],
-            "capacity": "Research and development complex",
-            "source": "KFUPM",
-            "verified": True
-        },
-        {
-            "name": "EXPEC Advanced Research Center",
-            "location": [26.2944, 50.1389],
-            "type": "Oil/Gas R&D",
-            "emissions": ["NO2", "CO", "CH4"],
-            "capacity": "Exploration and petroleum research",
-            "source": "Saudi Aramco",
-            "verified": True
-        },
-        {
-            "name": "Dhahran Power Plant",
-            "location": [26.2556, 50.0889],
-            "type": "Power Generation",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Power generation",
-            "source": "SEC",
-            "verified": True
-        }
-    ],
-
-    "Al-Khobar": [
-        {
-            "name": "Al-Khobar Industrial Area",
-            "location": [26.2889, 50.2111],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Light to medium industry",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "SCECO East Al-Khobar Station",
-            "location": [26.2722, 50.1944],
-            "type": "Power Generation",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Power generation",
-            "source": "SEC",
-            "verified": True
-        },
-        {
-            "name": "Zamil Steel Buildings",
-            "location": [26.2944, 50.2278],
-            "type": "Steel Manufacturing",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Pre-engineered steel buildings",
-            "source": "Zamil Industrial",
-            "verified": True
-        },
-        {
-            "name": "Al-Khobar Desalination Plant",
-            "location": [26.3111, 50.2389],
-            "type": "Desalination",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Water desalination",
-            "source": "SWCC",
-            "verified": True
-        }
-    ],
-
-    "Ras Tanura": [
-        {
-            "name": "Ras Tanura Refinery",
-            "location": [26.6389, 50.1611],
-            "type": "Oil Refinery",
-            "emissions": ["NO2", "SO2", "CO", "CH4", "HCHO"],
-            "capacity": "550,000 bpd",
-            "source": "Saudi Aramco",
-            "verified": True
-        },
-        {
-            "name": "Ras Tanura Oil Terminal",
-            "location": [26.6556, 50.1778],
-            "type": "Oil Terminal",
-            "emissions": ["NO2", "CH4", "HCHO"],
-            "capacity": "World's largest oil terminal",
-            "source": "Saudi Aramco",
-            "verified": True
-        },
-        {
-            "name": "Ras Tanura NGL Fractionation Plant",
-            "location": [26.6278, 50.1500],
-            "type": "Gas Processing",
-            "emissions": ["NO2", "SO2", "CH4"],
-            "capacity": "Natural gas liquids processing",
-            "source": "Saudi Aramco",
-            "verified": True
-        },
-        {
-            "name": "Ras Tanura Power Plant",
-            "location": [26.6167, 50.1389],
-            "type": "Power Generation",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Power generation for refinery",
-            "source": "Saudi Aramco",
-            "verified": True
-        },
-        {
-            "name": "Sea Island Loading Terminal",
-            "location": [26.6833, 50.2000],
-            "type": "Oil Loading Terminal",
-            "emissions": ["NO2", "CH4"],
-            "capacity": "VLCC loading operations",
-            "source": "Saudi Aramco",
-            "verified": True
-        }
-    ],
-
-    "Al-Ahsa": [
-        {
-            "name": "Al-Ahsa Industrial City",
-            "location": [25.3833, 49.6000],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Light to medium industry",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "Saudi Aramco Abqaiq Plants",
-            "location": [25.9333, 49.6667],
-            "type": "Oil Processing",
-            "emissions": ["NO2", "SO2", "CO", "CH4", "HCHO"],
-            "capacity": "World's largest oil processing facility",
-            "source": "Saudi Aramco",
-            "verified": True
-        },
-        {
-            "name": "Ghawar Oil Field Operations",
-            "location": [25.4167, 49.3333],
-            "type": "Oil Field",
-            "emissions": ["NO2", "CH4"],
-            "capacity": "World's largest oil field",
-            "source": "Saudi Aramco",
-            "verified": True
-        },
-        {
-            "name": "Al-Ahsa Date Processing Plants",
-            "location": [25.3667, 49.5833],
-            "type": "Food Processing",
-            "emissions": ["NO2", "CH4"],
-            "capacity": "Date processing",
-            "source": "Various",
-            "verified": True
-        },
-        {
-            "name": "National Petrochemical Industrial Co.",
-            "location": [25.4000, 49.6167],
-            "type": "Petrochemical",
-            "emissions": ["NO2", "SO2", "CO", "HCHO"],
-            "capacity": "Petrochemical products",
-            "source": "NATPET",
-            "verified": True
-        }
-    ],
-
-    # =========================================================================
-    # CENTRAL REGION
-    # =========================================================================
-    "Riyadh": [
-        {
-            "name": "Riyadh 1st Industrial City",
-            "location": [24.7444, 46.5667],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO", "HCHO"],
-            "capacity": "Major industrial zone",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "Riyadh 2nd Industrial City",
-            "location": [24.7889, 46.9667],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO", "HCHO"],
-            "capacity": "Major industrial zone",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "Riyadh 3rd Industrial City",
-            "location": [24.6333, 46.8667],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO", "HCHO"],
-            "capacity": "Major industrial zone",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "Yamama Cement Company",
-            "location": [24.5833, 46.6500],
-            "type": "Cement",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Cement production",
-            "source": "Yamama Cement",
-            "verified": True
-        },
-        {
-            "name": "Saudi Cement Company - Riyadh",
-            "location": [24.6111, 46.7222],
-            "type": "Cement",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Cement production",
-            "source": "Saudi Cement",
-            "verified": True
-        },
-        {
-            "name": "Riyadh Power Plant PP9",
-            "location": [24.6667, 46.6167],
-            "type": "Power Generation",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "3,900 MW",
-            "source": "SEC",
-            "verified": True
-        },
-        {
-            "name": "Riyadh Power Plant PP10",
-            "location": [24.7000, 46.8333],
-            "type": "Power Generation",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "4,000 MW",
-            "source": "SEC",
-            "verified": True
-        },
-        {
-            "name": "Saudi Pharmaceutical Industries",
-            "location": [24.7556, 46.5889],
-            "type": "Pharmaceutical",
-            "emissions": ["NO2", "HCHO"],
-            "capacity": "Pharmaceutical manufacturing",
-            "source": "SPIMACO",
-            "verified": True
-        },
-        {
-            "name": "Al-Rajhi Steel Industries",
-            "location": [24.7222, 46.9444],
-            "type": "Steel Manufacturing",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Steel production",
-            "source": "Rajhi Steel",
-            "verified": True
-        },
-        {
-            "name": "National Plastics Factory",
-            "location": [24.7611, 46.5722],
-            "type": "Plastics",
-            "emissions": ["NO2", "CO", "HCHO"],
-            "capacity": "Plastic products",
-            "source": "NPF",
-            "verified": True
-        },
-        {
-            "name": "Saudi White Cement Company",
-            "location": [24.5944, 46.6667],
-            "type": "Cement",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "White cement production",
-            "source": "Saudi White Cement",
-            "verified": True
-        },
-        {
-            "name": "Riyadh Dry Port",
-            "location": [24.6444, 46.8889],
-            "type": "Logistics",
-            "emissions": ["NO2", "CO"],
-            "capacity": "Inland container terminal",
-            "source": "Saudi Ports Authority",
-            "verified": True
-        }
-    ],
-
-    "Sudair": [
-        {
-            "name": "Sudair Industrial City",
-            "location": [25.5889, 45.6222],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO", "HCHO"],
-            "capacity": "Large industrial zone",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "Sudair Solar PV Plant (ACWA Power)",
-            "location": [25.5667, 45.6000],
-            "type": "Solar Power",
-            "emissions": ["NO2"],
-            "capacity": "1,500 MW solar",
-            "source": "ACWA Power",
-            "verified": True
-        },
-        {
-            "name": "Sudair City for Industry and Business",
-            "location": [25.6000, 45.6333],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Integrated industrial city",
-            "source": "Sudair Development Authority",
-            "verified": True
-        },
-        {
-            "name": "Advanced Electronics Company",
-            "location": [25.5778, 45.6111],
-            "type": "Electronics Manufacturing",
-            "emissions": ["NO2", "HCHO"],
-            "capacity": "Defense electronics",
-            "source": "AEC",
-            "verified": True
-        }
-    ],
-
-    "Qassim": [
-        {
-            "name": "Qassim Cement Company",
-            "location": [26.3056, 43.9667],
-            "type": "Cement",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Cement production",
-            "source": "Qassim Cement",
-            "verified": True
-        },
-        {
-            "name": "Qassim 1st Industrial City",
-            "location": [26.3333, 43.9500],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Industrial zone",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "Qassim 2nd Industrial City",
-            "location": [26.3611, 44.0167],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Industrial zone",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "Al-Rajhi Poultry & Food Processing",
-            "location": [26.2889, 43.9833],
-            "type": "Food Processing",
-            "emissions": ["NO2", "CH4"],
-            "capacity": "Poultry processing",
-            "source": "Al-Rajhi Group",
-            "verified": True
-        },
-        {
-            "name": "Qassim Agricultural Processing Zone",
-            "location": [26.3167, 43.9333],
-            "type": "Agricultural Processing",
-            "emissions": ["NO2", "CH4"],
-            "capacity": "Agricultural processing",
-            "source": "Various",
-            "verified": True
-        }
-    ],
-
-    # =========================================================================
-    # SOUTHERN REGION
-    # =========================================================================
-    "Jazan": [
-        {
-            "name": "Jazan Refinery & Terminal",
-            "location": [16.7089, 42.6734],
-            "type": "Oil Refinery",
-            "emissions": ["NO2", "SO2", "CO", "CH4", "HCHO"],
-            "capacity": "400,000 bpd",
-            "source": "Saudi Aramco (Operational since 2021)",
-            "verified": True
-        },
-        {
-            "name": "Jazan IGCC Power Plant",
-            "location": [16.7156, 42.6689],
-            "type": "Power Generation",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "3,800 MW (gasification)",
-            "source": "Saudi Aramco Power Company",
-            "verified": True
-        },
-        {
-            "name": "Jazan Economic City Industrial Zone",
-            "location": [16.8892, 42.5511],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO", "HCHO", "CH4"],
-            "capacity": "Various light industries",
-            "source": "Jazan Economic City Authority",
-            "verified": True
-        },
-        {
-            "name": "Jazan Port Industrial Complex",
-            "location": [16.8750, 42.5833],
-            "type": "Port / Logistics",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Port operations and logistics",
-            "source": "Saudi Ports Authority",
-            "verified": True
-        },
-        {
-            "name": "Jazan City for Primary and Downstream Industries (JCPDI)",
-            "location": [16.8000, 42.6500],
-            "type": "Petrochemical",
-            "emissions": ["NO2", "SO2", "CO", "HCHO", "CH4"],
-            "capacity": "Downstream industries",
-            "source": "Royal Commission for Jubail and Yanbu",
-            "verified": True
-        }
-    ],
-
-    "Abha": [
-        {
-            "name": "Abha Industrial City",
-            "location": [18.2333, 42.4833],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Light industry",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "Asir Cement Factory",
-            "location": [18.1944, 42.5111],
-            "type": "Cement",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Cement production",
-            "source": "Southern Province Cement",
-            "verified": True
-        },
-        {
-            "name": "Abha Power Plant",
-            "location": [18.2111, 42.4944],
-            "type": "Power Generation",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Regional power supply",
-            "source": "SEC",
-            "verified": True
-        },
-        {
-            "name": "Asir Agricultural Processing",
-            "location": [18.2278, 42.5000],
-            "type": "Agricultural Processing",
-            "emissions": ["NO2", "CH4"],
-            "capacity": "Regional agricultural products",
-            "source": "Various",
-            "verified": True
-        }
-    ],
-
-    "Najran": [
-        {
-            "name": "Najran Cement Company",
-            "location": [17.4833, 44.1500],
-            "type": "Cement",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Cement production",
-            "source": "Najran Cement",
-            "verified": True
-        },
-        {
-            "name": "Najran Industrial City",
-            "location": [17.5056, 44.1333],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Light industry",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "Najran Power Plant",
-            "location": [17.4722, 44.1222],
-            "type": "Power Generation",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Regional power supply",
-            "source": "SEC",
-            "verified": True
-        }
-    ],
-
-    # =========================================================================
-    # NORTHERN REGION
-    # =========================================================================
-    "Tabuk": [
-        {
-            "name": "Tabuk Industrial City",
-            "location": [28.3722, 36.5667],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Industrial zone",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "Tabuk Cement Company",
-            "location": [28.3556, 36.5444],
-            "type": "Cement",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Cement production",
-            "source": "Tabuk Cement",
-            "verified": True
-        },
-        {
-            "name": "Tabuk Power Plant",
-            "location": [28.3889, 36.5778],
-            "type": "Power Generation",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Regional power supply",
-            "source": "SEC",
-            "verified": True
-        },
-        {
-            "name": "NEOM Industrial Zone (Phase 1)",
-            "location": [28.0000, 34.8333],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO", "HCHO"],
-            "capacity": "Future city development",
-            "source": "NEOM",
-            "verified": True
-        },
-        {
-            "name": "Tabuk Agricultural Company",
-            "location": [28.3611, 36.5889],
-            "type": "Agricultural Processing",
-            "emissions": ["NO2", "CH4"],
-            "capacity": "Agricultural products",
-            "source": "TADCO",
-            "verified": True
-        }
-    ],
-
-    "Hail": [
-        {
-            "name": "Hail Industrial City",
-            "location": [27.5222, 41.7000],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Industrial zone",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "Hail Cement Company",
-            "location": [27.4944, 41.7333],
-            "type": "Cement",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Cement production",
-            "source": "Hail Cement",
-            "verified": True
-        },
-        {
-            "name": "Hail Agricultural Development",
-            "location": [27.5111, 41.7111],
-            "type": "Agricultural Processing",
-            "emissions": ["NO2", "CH4"],
-            "capacity": "Agricultural processing",
-            "source": "HADCO",
-            "verified": True
-        },
-        {
-            "name": "Hail Power Plant",
-            "location": [27.5056, 41.7222],
-            "type": "Power Generation",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Regional power supply",
-            "source": "SEC",
-            "verified": True
-        }
-    ],
-
-    "Al-Jouf": [
-        {
-            "name": "Al-Jouf Agricultural Development (JADCO)",
-            "location": [29.8222, 40.0833],
-            "type": "Agricultural Processing",
-            "emissions": ["NO2", "CH4"],
-            "capacity": "Olive and agricultural processing",
-            "source": "JADCO",
-            "verified": True
-        },
-        {
-            "name": "Al-Jouf Industrial City",
-            "location": [29.7944, 40.1167],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Light industry",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "Al-Jouf Cement Factory",
-            "location": [29.8056, 40.0944],
-            "type": "Cement",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Cement production",
-            "source": "Northern Region Cement",
-            "verified": True
-        },
-        {
-            "name": "Sakaka Power Plant",
-            "location": [29.8111, 40.1000],
-            "type": "Power Generation",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Regional power supply",
-            "source": "SEC",
-            "verified": True
-        }
-    ],
-
-    "Arar": [
-        {
-            "name": "Arar Industrial Zone",
-            "location": [30.9667, 41.0222],
-            "type": "Mixed Industrial",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Border trade and light industry",
-            "source": "MODON",
-            "verified": True
-        },
-        {
-            "name": "Arar Power Plant",
-            "location": [30.9556, 41.0111],
-            "type": "Power Generation",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Regional power supply",
-            "source": "SEC",
-            "verified": True
-        },
-        {
-            "name": "Northern Border Cement",
-            "location": [30.9778, 41.0333],
-            "type": "Cement",
-            "emissions": ["NO2", "SO2", "CO"],
-            "capacity": "Cement production",
-            "source": "Northern Cement",
-            "verified": True
-        }
-    ]
+FACTORIES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "factories.jsonl")
+
+# Shared emissions tuples: facilities with the same gas list reuse one object
+_EMISSION_SETS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _emission_set(gases) -> Tuple[str, ...]:
+    """Interned, pooled tuple for a list of emitted gases."""
+    key = tuple(sys.intern(gas) for gas in gases)
+    return _EMISSION_SETS.setdefault(key, key)
+
+
+# Required fields of a factories.jsonl row and their accepted types ("verified" is optional)
+_ROW_SCHEMA = {
+    "city": str,
+    "name": str,
+    "lat": (int, float),
+    "lon": (int, float),
+    "type": str,
+    "emissions": list,
+    "capacity": str,
+    "source": str,
 }
 
+
+def _validate_row(row: Dict) -> None:
+    """Check a parsed registry row once at load, so record access needs no guards."""
+    label = row.get("name", "<unnamed>")
+    for field, kind in _ROW_SCHEMA.items():
+        value = row.get(field)
+        if not isinstance(value, kind) or isinstance(value, bool):
+            raise ValueError(f"Invalid factory row {label}: bad or missing '{field}'")
+    if not (-90 <= row["lat"] <= 90 and -180 <= row["lon"] <= 180):
+        raise ValueError(f"Invalid factory row {label}: coordinates out of range")
+    unknown = [gas for gas in row["emissions"] if gas not in GAS_PRODUCTS]
+    if unknown:
+        raise ValueError(f"Invalid factory row {label}: unknown emissions {unknown}")
+    if not isinstance(row.get("verified", False), bool):
+        raise ValueError(f"Invalid factory row {label}: 'verified' must be a boolean")
+
+
+class Facility(NamedTuple):
+    """Immutable industrial facility record."""
+    name: str
+    lat: float
+    lon: float
+    type: str
+    emissions: Tuple[str, ...]
+    capacity: str
+    source: str
+    verified: bool
+
+    @classmethod
+    def from_row(cls, row: Dict) -> "Facility":
+        """Build a record from a parsed factories.jsonl row, raising ValueError if malformed."""
+        _validate_row(row)
+        return cls(
+            name=row["name"],
+            lat=float(row["lat"]),
+            lon=float(row["lon"]),
+            # Categorical fields repeat across rows; intern so equal values share one str
+            type=sys.intern(row["type"]),
+            emissions=_emission_set(row["emissions"]),
+            capacity=row["capacity"],
+            source=sys.intern(row["source"]),
+            verified=row.get("verified", False),
+        )
+
+    def to_dict(self) -> Dict:
+        """Dict form used for analysis results, map popups and Firestore records."""
+        return {
+            "name": self.name,
+            "location": [self.lat, self.lon],
+            "type": self.type,
+            "emissions": list(self.emissions),
+            "capacity": self.capacity,
+            "source": self.source,
+            "verified": self.verified,
+        }
+
+
+_CITY_PREFIX = re.compile(rb'^\{"city":\s*"([^"\\]*)"')
+
+
+class _FactoryMap(Mapping):
+    """
+    Read-only mapping of city name -> tuple of Facility records, backed by FACTORIES_FILE.
+
+    Both the mapping and its values are immutable, so callers can share them
+    freely without defensive copies.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._buffer = None
+        self._offsets = None
+        self._cache = {}
+
+    def _data(self) -> mmap.mmap:
+        """The registry file, memory-mapped once (read-only) and shared by every lookup."""
+        if self._buffer is None:
+            with open(self._path, "rb") as f:
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._buffer
+
+    @staticmethod
+    def _city_of(line: bytes) -> str:
+        """Read the city of a row without parsing the whole line when possible."""
+        match = _CITY_PREFIX.match(line)
+        if match:
+            return match.group(1).decode("utf-8")
+        return _json_loads(line)["city"]
+
+    def _index(self) -> dict:
+        """Byte range of each city's rows, built with a single pass over the file."""
+        if self._offsets is None:
+            offsets = {}
+            data = self._data()
+            pos = 0
+            for line in iter(data.readline, b""):
+                end = pos + len(line)
+                if line.strip():
+                    city = self._city_of(line)
+                    start = offsets[city][0] if city in offsets else pos
+                    offsets[city] = (start, end)
+                pos = end
+            self._offsets = offsets
+        return self._offsets
+
+    def __getitem__(self, city: str) -> Tuple[Facility, ...]:
+        cached = self._cache.get(city)
+        if cached is not None:
+            return cached
+
+        start, end = self._index()[city]
+        chunk = self._data()[start:end]
+
+        factories = tuple(
+            Facility.from_row(row)
+            for row in map(_json_loads, filter(bytes.strip, chunk.splitlines()))
+            if row["city"] == city
+        )
+
+        return self._cache.setdefault(city, factories)
+
+    def __iter__(self):
+        return iter(self._index())
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+
+FACTORIES = _FactoryMap(FACTORIES_FILE)
+
 # =============================================================================
 # WIND DATA CONFIGURATION
 # Data sources for wind direction/speed used in source attribution
 # =============================================================================
-WIND_SOURCES = [
-    {
-        "id": "era5_land_hourly",
-        "label": "ECMWF ERA5-Land Hourly",
-        "dataset": "ECMWF/ERA5_LAND/HOURLY",
-        "u_component": "u_component_of_wind_10m",
-        "v_component": "v_component_of_wind_10m",
-        "scale": 11132,
-        "search_windows_hours": [1, 2, 3, 6, 12, 24, 48, 72],
-        "forward_search_hours": 0,
-        "max_time_offset_hours": 72,
-        "base_reliability": 0.95,
-        "sample_radius_km": 30,
-    },
-    {
-        "id": "noaa_gfs",
-        "label": "NOAA GFS",
-        "dataset": "NOAA/GFS0P25",
-        "u_component": "u_component_of_wind_10m_above_ground",
-        "v_component": "v_component_of_wind_10m_above_ground",
-        "scale": 27830,
-        "search_windows_hours": [1, 3, 6, 12, 24, 48],
-        "forward_search_hours": 0,
-        "max_time_offset_hours": 48,
-        "base_reliability": 0.92,
-        "sample_radius_km": 40,
-    },
-    {
-        "id": "era5_daily",
-        "label": "ECMWF ERA5 Daily",
-        "dataset": "ECMWF/ERA5/DAILY",
-        "u_component": "u_component_of_wind_10m",
-        "v_component": "v_component_of_wind_10m",
-        "scale": 27830,
-        "search_windows_hours": [24, 72],
-        "forward_search_hours": 0,
-        "max_time_offset_hours": 72,
-        "base_reliability": 0.90,
-        "sample_radius_km": 50,
-    },
-]
+class WindSource(NamedTuple):
+    """Immutable description of a gridded wind dataset in Earth Engine."""
+    id: str
+    label: str
+    dataset: str
+    u_component: str
+    v_component: str
+    scale: int
+    search_windows_hours: Tuple[int, ...]
+    forward_search_hours: int
+    max_time_offset_hours: int
+    base_reliability: float
+    sample_radius_km: int
+
+
+WIND_SOURCES = (
+    WindSource(
+        id="era5_land_hourly",
+        label="ECMWF ERA5-Land Hourly",
+        dataset="ECMWF/ERA5_LAND/HOURLY",
+        u_component="u_component_of_wind_10m",
+        v_component="v_component_of_wind_10m",
+        scale=11132,
+        search_windows_hours=(1, 2, 3, 6, 12, 24, 48, 72),
+        forward_search_hours=0,
+        max_time_offset_hours=72,
+        base_reliability=0.95,
+        sample_radius_km=30,
+    ),
+    WindSource(
+        id="noaa_gfs",
+        label="NOAA GFS",
+        dataset="NOAA/GFS0P25",
+        u_component="u_component_of_wind_10m_above_ground",
+        v_component="v_component_of_wind_10m_above_ground",
+        scale=27830,
+        search_windows_hours=(1, 3, 6, 12, 24, 48),
+        forward_search_hours=0,
+        max_time_offset_hours=48,
+        base_reliability=0.92,
+        sample_radius_km=40,
+    ),
+    WindSource(
+        id="era5_daily",
+        label="ECMWF ERA5 Daily",
+        dataset="ECMWF/ERA5/DAILY",
+        u_component="u_component_of_wind_10m",
+        v_component="v_component_of_wind_10m",
+        scale=27830,
+        search_windows_hours=(24, 72),
+        forward_search_hours=0,
+        max_time_offset_hours=72,
+        base_reliability=0.90,
+        sample_radius_km=50,
+    ),
+)
 
 WIND_DEFAULTS = {
     "speed_ms": 2.0,
@@ -1564,16 +545,28 @@ LOG_DIR = os.path.join(BASE_DIR, "logs")
 VIOLATION_DIR = os.path.join(BASE_DIR, "violations")
 LIVE_VIOLATIONS_FILE = os.path.join(LOG_DIR, "live_violations.json")
 
-for directory in [DATA_DIR, LOG_DIR, VIOLATION_DIR]:
-    os.makedirs(directory, exist_ok=True)
+
+
+@lru_cache(maxsize=None)
+def ensure_dirs() -> None:
+    """Create the data, log and violation directories (once per process) before writing."""
+    for directory in (DATA_DIR, LOG_DIR, VIOLATION_DIR):
+        os.makedirs(directory, exist_ok=True)
 
 
 # =============================================================================
 # NOTIFICATION CONFIGURATION
 # =============================================================================
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_CSV_SPLIT = re.compile(r"\s*,\s*")
+
+
 def _env_bool(name: str, default: bool = False) -> bool:
     """Parse environment variable into boolean flag."""
-    return os.getenv(name, str(default)).strip().lower() in ("1", "true", "yes", "on")
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUE_VALUES
 
 
 def _env_list(name: str, default: list[str]) -> list[str]:
@@ -1581,28 +574,39 @@ def _env_list(name: str, default: list[str]) -> list[str]:
     value = os.getenv(name)
     if not value:
         return default
-    return [item.strip() for item in value.split(",") if item.strip()]
+    return [item for item in _CSV_SPLIT.split(value.strip()) if item]
+
+
+@lru_cache(maxsize=None)
+def get_notification_config() -> Dict:
+    """Notification channel settings, read from the environment on first use."""
+    return {
+        "email": {
+            "enabled": _env_bool("EMAIL_NOTIFICATIONS_ENABLED", False),
+            "smtp_server": os.getenv("EMAIL_SMTP_SERVER", "smtp.gmail.com"),
+            "smtp_port": int(os.getenv("EMAIL_SMTP_PORT", "587")),
+            "sender_email": os.getenv("EMAIL_SENDER_ADDRESS", ""),
+            "sender_password": os.getenv("EMAIL_SENDER_PASSWORD", ""),
+            "recipients": _env_list("EMAIL_RECIPIENTS", []),
+        },
+        "webhook": {
+            "enabled": _env_bool("WEBHOOK_NOTIFICATIONS_ENABLED", False),
+            "url": os.getenv("WEBHOOK_URL", ""),
+        },
+        "telegram": {
+            "enabled": _env_bool("TELEGRAM_NOTIFICATIONS_ENABLED", False),
+            "bot_token": os.getenv("TELEGRAM_BOT_TOKEN", ""),
+            "chat_id": os.getenv("TELEGRAM_CHAT_ID", ""),
+        },
+    }
 
 
-NOTIFICATION_CONFIG = {
-    "email": {
-        "enabled": _env_bool("EMAIL_NOTIFICATIONS_ENABLED", False),
-        "smtp_server": os.getenv("EMAIL_SMTP_SERVER", "smtp.gmail.com"),
-        "smtp_port": int(os.getenv("EMAIL_SMTP_PORT", "587")),
-        "sender_email": os.getenv("EMAIL_SENDER_ADDRESS", ""),
-        "sender_password": os.getenv("EMAIL_SENDER_PASSWORD", ""),
-        "recipients": _env_list("EMAIL_RECIPIENTS", []),
-    },
-    "webhook": {
-        "enabled": _env_bool("WEBHOOK_NOTIFICATIONS_ENABLED", False),
-        "url": os.getenv("WEBHOOK_URL", ""),
-    },
-    "telegram": {
-        "enabled": _env_bool("TELEGRAM_NOTIFICATIONS_ENABLED", False),
-        "bot_token": os.getenv("TELEGRAM_BOT_TOKEN", ""),
-        "chat_id": os.getenv("TELEGRAM_CHAT_ID", ""),
-    },
-}
+def __getattr__(name: str):
+    # NOTIFICATION_CONFIG is built lazily so importing config does not read the environment
+    if name == "NOTIFICATION_CONFIG":
+        return get_notification_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 GEE_PROJECT = 'rcjyenviroment'
 LOG_LEVEL = "INFO"
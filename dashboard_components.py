@@ -11,7 +11,7 @@ from typing import Dict, List
 import pytz
 from datetime import datetime
 import config
-from translations import get_text
+from translations import get_text, format_text
 from benchmark_analyzer import CityBenchmarkAnalyzer
 
 
@@ -629,7 +629,7 @@ def create_gas_specific_ranking(gas_rankings: List[Dict], gas: str, lang: str =
                   annotation_text=get_text('threshold', lang))
 
     fig.update_layout(
-        title=get_text('gas_ranking_for', lang).format(gas=get_text(gas, lang)),
+        title=format_text('gas_ranking_for', lang, gas=get_text(gas, lang)),
         xaxis_title=get_text('threshold_percent', lang),
         yaxis_title=get_text('city', lang),
         height=max(400, len(cities_with_data) * 35),
@@ -9,7 +9,7 @@ import logging
 from datetime import datetime, timedelta
 import pytz
 import config
-from translations import get_text
+from translations import get_text, format_text
 
 logger = logging.getLogger(__name__)
 
@@ -275,7 +275,7 @@ class DataValidator:
                     violations.append(gas)
 
         if len(violations) > 1:
-            insight_text = get_text('insight_multiple_violations', lang).format(gases=', '.join(violations))
+            insight_text = format_text('insight_multiple_violations', lang, gases=', '.join(violations))
             insights.append(insight_text)
 
         # Check for unusual patterns
@@ -288,7 +288,7 @@ class DataValidator:
                     high_variance_gases.append(gas)
 
         if high_variance_gases:
-            insight_text = get_text('insight_high_variance', lang).format(gases=', '.join(high_variance_gases))
+            insight_text = format_text('insight_high_variance', lang, gases=', '.join(high_variance_gases))
             insights.append(insight_text)
 
         # Check wind patterns
@@ -0,0 +1,539 @@
+"""
+Factory Spatial Index Module
+
+Prebuilt spatial lookups over the industrial facility registry in config.FACTORIES,
+so source attribution does not rescan every facility per hotspot query.
+
+The index is built once at import:
+    - Facilities are flattened into NumPy columns (one contiguous (lat, lon)
+      block, city id) so distance filtering is one vectorized expression
+    - Rows are grouped by city, so each city is one contiguous slice of every
+      column (CITY_SLICES); per-city bounding boxes over facility coordinates
+      make point-in-city tests one array comparison and let radius queries
+      reject whole cities before any distance math
+    - Per-city centroid circles (centroid + enclosing radius) reject cities
+      with one haversine each in wide-radius queries
+    - Repeated categorical strings (type, source) are stored as small integer
+      codes into deduplicated vocabularies, and emissions as a uint8 bitmask
+    - Facilities are bucketed on a 0.5 degree integer grid, so tight-radius
+      queries gather candidates from a few (row, col) dict probes
+    - Every facility is geohashed (precision 7, ~150 m cells)
+    - Each geohash prefix maps to the facilities inside that cell, so a lookup at
+      any precision is a single dict probe
+    - Radius queries probe the query cell plus its 8 neighbours at a precision
+      whose cells are at least as large as the radius
+    - Co-located facilities share a rounded coordinate key so the map draws
+      one marker per site
+    - Facility radians and cos(lat) are precomputed for the distance kernel
+    - All index dicts are MappingProxyType views and all arrays are read-only,
+      so callers can share them without defensive copies
+"""
+
+import math
+import logging
+import numpy as np
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+import config
+
+logger = logging.getLogger(__name__)
+
+GEOHASH_PRECISION = 7
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+EARTH_RADIUS_KM = 6371.0
+# Kilometres per degree of latitude on the same sphere the distance kernel uses,
+# so boxes and cells sized from a radius always cover that radius
+_KM_PER_DEG = math.pi * EARTH_RADIUS_KM / 180.0
+
+
+def geohash_encode(lat: float, lon: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Encode a coordinate as a base32 geohash string."""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bit = 0
+    ch = 0
+    even = True
+
+    while len(chars) < precision:
+        rng, value = (lon_range, lon) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            ch = (ch << 1) | 1
+            rng[0] = mid
+        else:
+            ch = ch << 1
+            rng[1] = mid
+        even = not even
+        bit += 1
+        if bit == 5:
+            chars.append(_BASE32[ch])
+            bit = 0
+            ch = 0
+
+    return "".join(chars)
+
+
+def geohash_cell_size(precision: int) -> Tuple[float, float]:
+    """Return (lat_degrees, lon_degrees) extent of a geohash cell."""
+    bits = precision * 5
+    lon_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+
+def precision_for_radius(radius_km: float, lat: float) -> int:
+    """
+    Finest geohash precision whose cells are at least radius_km on each side.
+
+    Returns 0 when even a single-character cell is smaller than the radius.
+    """
+    cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_deg, lon_deg = geohash_cell_size(precision)
+        if (lat_deg * _KM_PER_DEG >= radius_km and
+                lon_deg * _KM_PER_DEG * cos_lat >= radius_km):
+            return precision
+    return 0
+
+
+
+FACTORY_ENTRIES: Tuple[Tuple[str, config.Facility], ...] = tuple(
+    (city, factory)
+    for city, factories in config.FACTORIES.items()
+    for factory in factories
+)
+CITY_NAMES = tuple(config.FACTORIES.keys())
+CITY_IDS_BY_NAME = MappingProxyType({city: i for i, city in enumerate(CITY_NAMES)})
+
+
+def _build_city_slices() -> Tuple[slice, ...]:
+    """Registry rows are grouped by city, so each city owns one contiguous range."""
+    slices, start = [], 0
+    for city in CITY_NAMES:
+        count = len(config.FACTORIES[city])
+        slices.append(slice(start, start + count))
+        start += count
+    return tuple(slices)
+
+
+# City id -> slice of registry rows; column[CITY_SLICES[i]] is a view, not a copy
+CITY_SLICES = _build_city_slices()
+NAMES = np.array([f.name for _, f in FACTORY_ENTRIES], dtype=object)
+
+# Categorical vocabularies: column values are indices into these tuples
+TYPE_VOCAB = tuple(sorted({f.type for _, f in FACTORY_ENTRIES}))
+SOURCE_VOCAB = tuple(sorted({f.source for _, f in FACTORY_ENTRIES}))
+TYPE_CODES = MappingProxyType({name: code for code, name in enumerate(TYPE_VOCAB)})
+SOURCE_CODES = MappingProxyType({name: code for code, name in enumerate(SOURCE_VOCAB)})
+TYPE_IDS = np.array([TYPE_CODES[f.type] for _, f in FACTORY_ENTRIES], dtype=np.uint8)
+SOURCE_IDS = np.array([SOURCE_CODES[f.source] for _, f in FACTORY_ENTRIES], dtype=np.uint16)
+
+
+# Emission bitmask: one bit per monitored gas
+EMIT_NO2 = 1
+EMIT_SO2 = 2
+EMIT_CO = 4
+EMIT_CH4 = 8
+EMIT_HCHO = 16
+EMIT_CODES = MappingProxyType({'NO2': EMIT_NO2, 'SO2': EMIT_SO2, 'CO': EMIT_CO,
+                               'CH4': EMIT_CH4, 'HCHO': EMIT_HCHO})
+
+
+def emission_mask(gases) -> int:
+    """Combine gas names into an emission bitmask."""
+    mask = 0
+    for gas in gases:
+        mask |= EMIT_CODES[gas]
+    return mask
+
+
+EMISSION_MASK = np.array([emission_mask(f.emissions) for _, f in FACTORY_ENTRIES], dtype=np.uint8)
+
+
+def factories_emitting(mask: int, require_all: bool = False) -> np.ndarray:
+    """
+    Registry indices of facilities emitting gases in the bitmask.
+
+    Args:
+        mask: Emission bitmask (see emission_mask)
+        require_all: Match only facilities emitting every gas in mask, instead
+            of any of them
+
+    Returns:
+        Registry indices in registry order
+    """
+    if require_all:
+        return np.flatnonzero((EMISSION_MASK & mask) == mask)
+    return np.flatnonzero(EMISSION_MASK & mask)
+
+
+# Reverse index: facility type -> registry indices of that type
+BY_TYPE = MappingProxyType({name: np.flatnonzero(TYPE_IDS == code).astype(np.int32)
+                            for name, code in TYPE_CODES.items()})
+_NO_FACILITIES = np.empty(0, dtype=np.int32)
+
+
+def facilities_of_type(facility_type: str) -> np.ndarray:
+    """Registry indices of every facility of the given type (e.g. 'Oil Refinery')."""
+    return BY_TYPE.get(facility_type, _NO_FACILITIES)
+
+
+def factory_type(i: int) -> str:
+    """Facility type for registry index i."""
+    return TYPE_VOCAB[TYPE_IDS[i]]
+
+
+def factory_source(i: int) -> str:
+    """Data source / operator for registry index i."""
+    return SOURCE_VOCAB[SOURCE_IDS[i]]
+
+
+def _compute_columns() -> Dict[str, np.ndarray]:
+    """Derive the numeric columns and geohashes from FACTORY_ENTRIES."""
+    coords = np.array([(f.lat, f.lon) for _, f in FACTORY_ENTRIES],
+                      dtype=np.float64).reshape(-1, 2)
+    return {
+        'coords': coords,
+        'city_ids': np.array([CITY_IDS_BY_NAME[c] for c, _ in FACTORY_ENTRIES], dtype=np.int16),
+        'geohashes': np.array([geohash_encode(lat, lon) for lat, lon in coords.tolist()],
+                              dtype=f'<U{GEOHASH_PRECISION}'),
+    }
+
+
+def _build_buckets(geohashes: np.ndarray) -> Mapping[str, Tuple[int, ...]]:
+    """Bucket every facility under each prefix of its geohash."""
+    buckets: Dict[str, List[int]] = {}
+    for idx, gh in enumerate(geohashes.tolist()):
+        for length in range(1, GEOHASH_PRECISION + 1):
+            buckets.setdefault(gh[:length], []).append(idx)
+    return MappingProxyType({prefix: tuple(members) for prefix, members in buckets.items()})
+
+
+_COLUMNS = _compute_columns()
+# One contiguous float64[N, 2] (lat, lon) block; LATS / LONS are strided views of it
+COORDS = _COLUMNS['coords']
+LATS = COORDS[:, 0]
+LONS = COORDS[:, 1]
+CITY_IDS = _COLUMNS['city_ids']
+GEO_BUCKETS = _build_buckets(_COLUMNS['geohashes'])
+
+# Radians and cos(lat) per facility, so distance queries skip the conversions
+LAT_RAD = np.radians(LATS)
+LON_RAD = np.radians(LONS)
+COS_LAT = np.cos(LAT_RAD)
+
+
+# Inverted index: city id -> registry indices of that city's facilities
+CITY_MEMBERS = tuple(np.arange(s.start, s.stop) for s in CITY_SLICES)
+
+
+def _build_city_bboxes() -> np.ndarray:
+    """Per-city (lat_min, lat_max, lon_min, lon_max) over its facilities, in city-id order."""
+    bboxes = np.full((len(CITY_NAMES), 4), np.nan, dtype=np.float64)
+    for city_id, members in enumerate(CITY_MEMBERS):
+        if len(members):
+            bboxes[city_id] = (LATS[members].min(), LATS[members].max(),
+                               LONS[members].min(), LONS[members].max())
+    return bboxes
+
+
+CITY_BBOXES = _build_city_bboxes()
+
+
+def cities_containing(lat: float, lon: float) -> List[str]:
+    """Cities whose facility bounding box contains the point."""
+    mask = ((CITY_BBOXES[:, 0] <= lat) & (lat <= CITY_BBOXES[:, 1]) &
+            (CITY_BBOXES[:, 2] <= lon) & (lon <= CITY_BBOXES[:, 3]))
+    return [CITY_NAMES[i] for i in np.flatnonzero(mask)]
+
+
+def cities_intersecting(lat_min: float, lat_max: float,
+                        lon_min: float, lon_max: float) -> np.ndarray:
+    """City ids whose facility bounding box overlaps a lat/lon box (4 compares per city)."""
+    mask = ((CITY_BBOXES[:, 0] <= lat_max) & (CITY_BBOXES[:, 1] >= lat_min) &
+            (CITY_BBOXES[:, 2] <= lon_max) & (CITY_BBOXES[:, 3] >= lon_min))
+    return np.flatnonzero(mask)
+
+
+# Facilities sharing a location (to 4 decimals, ~11 m) are drawn as one map
+# marker per site; coord_key is the grouping key
+COORD_DECIMALS = 4
+
+
+def coord_key(lat: float, lon: float) -> Tuple[float, float]:
+    """Grouping key for a coordinate (rounded to COORD_DECIMALS)."""
+    return round(float(lat), COORD_DECIMALS), round(float(lon), COORD_DECIMALS)
+
+
+def haversine_km(lat: float, lon: float,
+                 lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Great-circle distance (km) from one point to arrays of points."""
+    lat1 = np.radians(lat)
+    lat2 = np.radians(lats)
+    dlat = lat2 - lat1
+    dlon = np.radians(lons) - np.radians(lon)
+
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def _build_city_circles() -> Tuple[np.ndarray, np.ndarray]:
+    """Per-city centroid (lat, lon) of its facilities and the radius (km) enclosing them all."""
+    centroids = np.full((len(CITY_NAMES), 2), np.nan, dtype=np.float64)
+    radii = np.full(len(CITY_NAMES), np.nan, dtype=np.float64)
+    for city_id, rows in enumerate(CITY_SLICES):
+        if rows.stop > rows.start:
+            clat, clon = COORDS[rows].mean(axis=0)
+            centroids[city_id] = (clat, clon)
+            radii[city_id] = haversine_km(clat, clon, LATS[rows], LONS[rows]).max()
+    return centroids, radii
+
+
+# City id -> facility centroid and enclosing radius, for coarse circle rejects
+CITY_CENTROIDS, CITY_RADII_KM = _build_city_circles()
+
+
+def cities_near(lat: float, lon: float, radius_km: float) -> np.ndarray:
+    """
+    City ids that may have facilities within radius_km of a point.
+
+    One haversine per city: a city is rejected when its centroid is further
+    than radius_km plus the city's own enclosing radius.
+    """
+    distances = haversine_km(lat, lon, CITY_CENTROIDS[:, 0], CITY_CENTROIDS[:, 1])
+    # Small slack so rounding never rejects a facility exactly on the boundary
+    return np.flatnonzero(distances <= radius_km + CITY_RADII_KM + 1e-6)
+
+
+# Coarse integer grid (0.5 degree, ~55 km cells): (row, col) -> registry indices
+GRID_CELL_DEG = 0.5
+
+
+def grid_cell(lat: float, lon: float) -> Tuple[int, int]:
+    """(row, col) of the GRID_CELL_DEG cell containing a point."""
+    return math.floor(lat / GRID_CELL_DEG), math.floor(lon / GRID_CELL_DEG)
+
+
+def _build_site_grid() -> Mapping[Tuple[int, int], np.ndarray]:
+    """Bucket every facility into its grid cell."""
+    rows = np.floor(LATS / GRID_CELL_DEG).astype(np.int64)
+    cols = np.floor(LONS / GRID_CELL_DEG).astype(np.int64)
+    grid: Dict[Tuple[int, int], List[int]] = {}
+    for idx, key in enumerate(zip(rows.tolist(), cols.tolist())):
+        grid.setdefault(key, []).append(idx)
+    return MappingProxyType({key: np.array(members, dtype=np.intp) for key, members in grid.items()})
+
+
+SITE_GRID = _build_site_grid()
+
+
+# Below this geohash precision (cells > ~150 km) candidates come from city bboxes
+_CITY_PRUNE_PRECISION = 3
+
+
+def radius_bbox(lat: float, lon: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """(lat_min, lat_max, lon_min, lon_max) enclosing a radius_km circle around a point."""
+    # Same 1e-6 km slack as cities_near, so rounding never clips a boundary facility
+    dlat = (radius_km + 1e-6) / _KM_PER_DEG
+    cos_lat = max(math.cos(math.radians(min(abs(lat) + dlat, 89.0))), 1e-6)
+    dlon = (radius_km + 1e-6) / (_KM_PER_DEG * cos_lat)
+    return lat - dlat, lat + dlat, lon - dlon, lon + dlon
+
+
+def facility_distances(lat: float, lon: float, idx: np.ndarray) -> np.ndarray:
+    """
+    Great-circle distance (km) from a point to the facilities at registry indices idx.
+
+    Reads the precomputed LAT_RAD / LON_RAD / COS_LAT columns, so only the query
+    point is converted per call.
+    """
+    lat1 = math.radians(lat)
+    sin_dlat = np.sin((LAT_RAD[idx] - lat1) * 0.5)
+    sin_dlon = np.sin((LON_RAD[idx] - math.radians(lon)) * 0.5)
+    a = sin_dlat * sin_dlat + math.cos(lat1) * COS_LAT[idx] * sin_dlon * sin_dlon
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def candidate_indices(lat: float, lon: float, radius_km: float) -> np.ndarray:
+    """
+    Registry indices of facilities that may lie within radius_km of a point.
+
+    Tight radii probe the integer grid cells under the radius bbox (at most
+    3 x 3); wider ones probe the geohash cell containing the point and its 8
+    neighbours. Either way every facility within the radius is returned (plus
+    some further away).
+    """
+    lat_min, lat_max, lon_min, lon_max = radius_bbox(lat, lon, radius_km)
+    row0, col0 = grid_cell(lat_min, lon_min)
+    row1, col1 = grid_cell(lat_max, lon_max)
+    if row1 - row0 < 3 and col1 - col0 < 3:
+        cells = [SITE_GRID[key] for key in
+                 ((r, c) for r in range(row0, row1 + 1) for c in range(col0, col1 + 1))
+                 if key in SITE_GRID]
+        if not cells:
+            return np.empty(0, dtype=np.intp)
+        return np.sort(np.concatenate(cells))
+
+    precision = precision_for_radius(radius_km, lat)
+    if precision < _CITY_PRUNE_PRECISION:
+        # Geohash cells this coarse span several cities: prune whole cities by
+        # bbox, then by centroid circle
+        city_ids = cities_intersecting(*radius_bbox(lat, lon, radius_km))
+        city_ids = np.intersect1d(city_ids, cities_near(lat, lon, radius_km))
+        return np.sort(np.concatenate([np.empty(0, dtype=np.intp)] +
+                                      [CITY_MEMBERS[c] for c in city_ids]))
+
+    lat_deg, lon_deg = geohash_cell_size(precision)
+    found = set()
+    for dlat in (-lat_deg, 0.0, lat_deg):
+        for dlon in (-lon_deg, 0.0, lon_deg):
+            cell = geohash_encode(lat + dlat, lon + dlon, precision)
+            found.update(GEO_BUCKETS.get(cell, ()))
+
+    return np.array(sorted(found), dtype=np.intp)
+
+
+def lookup_near(lat: float, lon: float, radius_km: float) -> List[Tuple[str, config.Facility]]:
+    """
+    Candidate facilities that may lie within radius_km of a point.
+
+    Args:
+        lat: Query latitude
+        lon: Query longitude
+        radius_km: Search radius
+
+    Returns:
+        List of (city, Facility) candidates in registry order, to refine with an
+        exact distance
+    """
+    return [FACTORY_ENTRIES[i] for i in candidate_indices(lat, lon, radius_km)]
+
+
+def within_radius(lat: float, lon: float, radius_km: float,
+                  city: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Facilities within radius_km of a point, nearest first.
+
+    Args:
+        lat: Query latitude
+        lon: Query longitude
+        radius_km: Search radius
+        city: Restrict results to this city's facilities (None for all cities)
+
+    Returns:
+        Tuple of (registry indices, distances in km), sorted by distance
+    """
+    if city is not None:
+        city_id = CITY_IDS_BY_NAME.get(city)
+        # Reject the whole city with one bbox test, else scan its contiguous rows
+        if city_id is None or city_id not in cities_intersecting(*radius_bbox(lat, lon, radius_km)):
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64)
+        idx = CITY_MEMBERS[city_id]
+    else:
+        idx = candidate_indices(lat, lon, radius_km)
+
+    distances = facility_distances(lat, lon, idx)
+    keep = distances <= radius_km
+    idx, distances = idx[keep], distances[keep]
+
+    order = np.argsort(distances, kind='stable')
+    return idx[order], distances[order]
+
+
+def find_sites_within_km(lat: float, lon: float, radius_km: float) -> np.ndarray:
+    """
+    Registry indices of facilities (any city) within radius_km of a point.
+
+    One vectorized haversine over the packed coordinate columns, nearest
+    first; no per-facility dict access.
+    """
+    return within_radius(lat, lon, radius_km)[0]
+
+
+@lru_cache(maxsize=4096)
+def nearby(lat: float, lon: float, radius_km: float,
+           city: Optional[str] = None) -> Tuple[Tuple[int, float], ...]:
+    """
+    Memoized within_radius() for repeated queries (e.g. Streamlit reruns).
+
+    The registry is fixed for the life of the process, so results never go
+    stale. Returns hashable ((registry index, distance_km), ...) nearest first.
+    """
+    indices, distances = within_radius(lat, lon, radius_km, city)
+    return tuple(zip(indices.tolist(), distances.tolist()))
+
+
+def _boundary_queries(radii):
+    """Query points just inside radius r of each facility (due N/S/E/W), per radius."""
+    for i, (city, _) in enumerate(FACTORY_ENTRIES):
+        for radius_km in radii:
+            for fraction in (0.9995, 0.9999):
+                # Placed from the sphere radius, independently of _KM_PER_DEG
+                dlat = math.degrees(fraction * radius_km / EARTH_RADIUS_KM)
+                dlon = dlat / max(math.cos(math.radians(LATS[i])), 1e-6)
+                for qlat, qlon in ((LATS[i] + dlat, LONS[i]), (LATS[i] - dlat, LONS[i]),
+                                   (LATS[i], LONS[i] + dlon), (LATS[i], LONS[i] - dlon)):
+                    yield float(qlat), float(qlon), radius_km, city
+
+
+def _brute_force(lat: float, lon: float, radius_km: float, rows=slice(None)) -> Tuple[set, set]:
+    """
+    Linear-scan reference: (registry indices within radius, indices too close
+    to the boundary to compare, i.e. within 1e-9 km of it).
+    """
+    idx = np.arange(len(LATS))[rows]
+    distances = haversine_km(lat, lon, LATS[idx], LONS[idx])
+    ambiguous = np.abs(distances - radius_km) < 1e-9
+    return set(idx[(distances <= radius_km) & ~ambiguous].tolist()), set(idx[ambiguous].tolist())
+
+
+def verify_index() -> List[str]:
+    """
+    Check radius queries against a brute-force scan of the registry.
+
+    Every facility is queried from points just inside the radius, where an
+    undersized bounding box or cell would drop it, both city-restricted and
+    across all cities.
+
+    Returns:
+        List of mismatch descriptions (empty when the index agrees)
+    """
+    problems = []
+    for lat, lon, radius_km, city in _boundary_queries((1, 5, 10, 20, 50)):
+        expected, ambiguous = _brute_force(lat, lon, radius_km, CITY_SLICES[CITY_IDS_BY_NAME[city]])
+        for label, found in (("within_radius", within_radius(lat, lon, radius_km, city)[0]),
+                             ("nearby", [i for i, _ in nearby(lat, lon, radius_km, city)])):
+            if set(found) - ambiguous != expected:
+                problems.append(f"{label}({lat:.5f}, {lon:.5f}, {radius_km}, {city!r}) "
+                                f"differs from brute force")
+
+    # Unrestricted queries: radii that take the grid, geohash and city-prune paths
+    for lat, lon, radius_km, _ in _boundary_queries((2, 5, 10, 50, 200, 400)):
+        expected, ambiguous = _brute_force(lat, lon, radius_km)
+        if set(find_sites_within_km(lat, lon, radius_km).tolist()) - ambiguous != expected:
+            problems.append(f"find_sites_within_km({lat:.5f}, {lon:.5f}, {radius_km}) "
+                            f"differs from brute force")
+    return problems
+
+
+def _freeze_arrays() -> None:
+    """Mark every index array read-only; the registry is fixed for the life of the process."""
+    arrays = [NAMES, TYPE_IDS, SOURCE_IDS, EMISSION_MASK, LATS, LONS, CITY_IDS, COORDS,
+              LAT_RAD, LON_RAD, COS_LAT, CITY_BBOXES, CITY_CENTROIDS, CITY_RADII_KM,
+              _NO_FACILITIES, *BY_TYPE.values(), *CITY_MEMBERS, *SITE_GRID.values()]
+    for array in arrays:
+        array.setflags(write=False)
+
+
+_freeze_arrays()
+
+
+if __name__ == "__main__":
+    # Index self-check: python factory_index.py
+    issues = verify_index()
+    for issue in issues[:20]:
+        print(issue)
+    print(f"{len(issues)} index mismatch(es) found" if issues else "Factory index OK")
+    raise SystemExit(1 if issues else 0)
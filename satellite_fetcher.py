@@ -426,27 +426,22 @@ class SatelliteDataFetcher:
 
     def _fetch_wind_from_source(
         self,
-        source_config: Dict,
+        source_config: config.WindSource,
         aoi: ee.Geometry,
         target_time: datetime,
         city: str
     ) -> Optional[Dict]:
         """Fetch wind from a specific configured source."""
-        dataset = source_config["dataset"]
-        u_band = source_config["u_component"]
-        v_band = source_config["v_component"]
-        scale = source_config.get("scale", 20000)
-        search_windows = sorted(
-            set(source_config.get("search_windows_hours", [3, 6, 12]))
-        )
-        forward_hours = source_config.get("forward_search_hours", 0)
-        max_offset_hours = source_config.get(
-            "max_time_offset_hours",
-            search_windows[-1] if search_windows else 24
-        )
-        base_reliability = source_config.get("base_reliability", 1.0)
-        label = source_config.get("label", dataset)
-        sample_radius_km = source_config.get("sample_radius_km", 20)
+        dataset = source_config.dataset
+        u_band = source_config.u_component
+        v_band = source_config.v_component
+        scale = source_config.scale
+        search_windows = sorted(set(source_config.search_windows_hours))
+        forward_hours = source_config.forward_search_hours
+        max_offset_hours = source_config.max_time_offset_hours
+        base_reliability = source_config.base_reliability
+        label = source_config.label or dataset
+        sample_radius_km = source_config.sample_radius_km
         sample_geometry = aoi.buffer(sample_radius_km * 1000).bounds()
 
         target_ms = int(target_time.timestamp() * 1000)
@@ -532,7 +527,7 @@ class SatelliteDataFetcher:
                 'confidence': float(confidence),
                 'confidence_breakdown': score_breakdown,
                 'source': dataset,
-                'source_id': source_config.get("id"),
+                'source_id': source_config.id,
                 'source_label': label,
             }
 
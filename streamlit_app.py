@@ -31,7 +31,7 @@ from analyzer import PollutionAnalyzer
 from visualizer import MapVisualizer
 from data_validator import DataValidator
 from violation_recorder import ViolationRecorder
-from translations import get_text, get_direction, get_font_family, TRANSLATIONS
+from translations import make_getter, get_texts, format_text, get_direction, get_font_family, LANGUAGES
 from dashboard_components import (
     create_aqi_dashboard,
     create_health_risk_panel,
@@ -128,9 +128,9 @@ st.set_page_config(
 )
 
 # Custom CSS for professional styling - injected after language is set
-def inject_custom_css():
-    """Inject CSS including RTL support for Arabic."""
-    lang = st.session_state.get('language', 'en')
+@st.cache_data(show_spinner=False)
+def _custom_css(lang: str) -> str:
+    """Build the <style> block for a language once; later reruns reuse the string."""
     direction = get_direction(lang)
     font_family = get_font_family(lang)
 
@@ -144,7 +144,7 @@ def inject_custom_css():
         }
     """ if lang == 'ar' else ""
 
-    st.markdown(f"""
+    return f"""
         <style>
         @import url('https://fonts.googleapis.com/css2?family=Noto+Sans+Arabic:wght@400;500;600;700&display=swap');
 
@@ -181,7 +181,12 @@ def inject_custom_css():
         }}
         {rtl_css}
         </style>
-        """, unsafe_allow_html=True)
+        """
+
+
+def inject_custom_css():
+    """Inject CSS including RTL support for Arabic."""
+    st.markdown(_custom_css(st.session_state.get('language', 'en')), unsafe_allow_html=True)
 
 # Initialize session state
 if 'selected_city' not in st.session_state:
@@ -196,7 +201,7 @@ if 'pollution_data' not in st.session_state:
     st.session_state.pollution_data = {}
 if 'alert_thresholds' not in st.session_state:
     st.session_state.alert_thresholds = {}
-if 'language' not in st.session_state:
+if st.session_state.get('language') not in LANGUAGES:
     st.session_state.language = 'en'
 if 'confirm_clear' not in st.session_state:
     st.session_state.confirm_clear = False
@@ -208,9 +213,14 @@ if 'benchmark_last_update' not in st.session_state:
     st.session_state.benchmark_last_update = None
 
 
-def t(key: str) -> str:
-    """Get translated text for current language."""
-    return get_text(key, st.session_state.language)
+# Translated text for the current language (fixed for the whole rerun: the
+# language selector only changes it from its on_change callback)
+t = make_getter(st.session_state.language)
+
+
+def tf(key: str, **kwargs) -> str:
+    """Get translated template for current language, filled with kwargs."""
+    return format_text(key, st.session_state.language, **kwargs)
 
 @st.cache_resource
 def initialize_services():
@@ -281,17 +291,18 @@ def create_header():
 def create_sidebar():
     """Configure sidebar with city selection, language toggle, and refresh controls."""
     with st.sidebar:
-        # Language selector at the top
-        st.selectbox(
-            "🌐 Language / اللغة",
-            options=["en", "ar"],
-            index=0 if st.session_state.language == "en" else 1,
-            format_func=lambda x: "English" if x == "en" else "العربية",
-            key="lang_selector",
-            on_change=lambda: setattr(st.session_state, 'language', st.session_state.lang_selector)
-        )
+        # Language selector at the top (hidden for single-language deployments)
+        if len(LANGUAGES) > 1:
+            st.selectbox(
+                "🌐 Language / اللغة",
+                options=list(LANGUAGES),
+                index=LANGUAGES.index(st.session_state.language),
+                format_func=lambda x: "English" if x == "en" else "العربية",
+                key="lang_selector",
+                on_change=lambda: setattr(st.session_state, 'language', st.session_state.lang_selector)
+            )
 
-        st.divider()
+            st.divider()
 
         st.header(f"⚙️ {t('control_panel')}")
 
@@ -426,7 +437,7 @@ def fetch_pollution_data(city: str, days_back: int):
     try:
         gases = list(config.GAS_PRODUCTS.keys())
         for i, gas in enumerate(gases):
-            status.text(t('retrieving_data').format(gas=gas))
+            status.text(tf('retrieving_data', gas=gas))
             progress.progress((i + 1) / len(gases))
 
             try:
@@ -448,7 +459,7 @@ def fetch_pollution_data(city: str, days_back: int):
             for error in errors:
                 st.write(f"• {error}")
     elif errors:
-        with st.expander(t('partial_data').format(count=len(errors))):
+        with st.expander(tf('partial_data', count=len(errors))):
             for error in errors:
                 st.write(f"• {error}")
 
@@ -1305,7 +1316,7 @@ def display_violation_history(city: str):
 
     # Display violations
     if violations:
-        st.subheader(f"📋 {t('showing_violations').format(count=len(violations))}")
+        st.subheader(f"📋 {tf('showing_violations', count=len(violations))}")
 
         for record in violations:
             with st.expander(
@@ -1406,15 +1417,14 @@ def main():
         pass
 
     # Main content with translated tabs
+    tab_labels = get_texts(
+        ('tab_overview', 'tab_aqi', 'tab_map', 'tab_analysis',
+         'tab_violations', 'tab_insights', 'tab_history', 'tab_benchmark'),
+        st.session_state.language
+    )
+    tab_icons = ("📊", "🌡️", "🗺️", "📈", "⚠️", "💡", "📜", "🏆")
     tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
-        f"📊 {t('tab_overview')}",
-        f"🌡️ {t('tab_aqi')}",
-        f"🗺️ {t('tab_map')}",
-        f"📈 {t('tab_analysis')}",
-        f"⚠️ {t('tab_violations')}",
-        f"💡 {t('tab_insights')}",
-        f"📜 {t('tab_history')}",
-        f"🏆 {t('tab_benchmark')}"
+        f"{icon} {label}" for icon, label in zip(tab_icons, tab_labels)
     ])
 
     # Fetch data
@@ -1446,7 +1456,7 @@ def main():
         # Show info message if gases have different data ages
         if len(data_ages) > 1:
             max_age = max(data_ages)
-            st.info(f"ℹ️ **{t('info')}:** {t('data_note_different_days').format(days=max_age)}")
+            st.info(f"ℹ️ **{t('info')}:** {tf('data_note_different_days', days=max_age)}")
 
         display_metrics(pollution_data)
 
@@ -1540,7 +1550,7 @@ def main():
             with st.spinner(t('auto_scanning')):
                 scan_results = scanner.scan_all_cities(days_back=7, auto_record_violations=True)
                 if scan_results.get('violations'):
-                    st.success(t('auto_scan_complete').format(
+                    st.success(tf('auto_scan_complete',
                         cities=scan_results['cities_with_data'],
                         violations=len(scan_results['violations']),
                         time=scan_results['scan_time']
@@ -1573,21 +1583,21 @@ def main():
                     with st.spinner(t('scanning_all_cities')):
                         results = scanner.scan_all_cities(days_back=7, auto_record_violations=True)
 
-                    st.success(t('scan_complete').format(
+                    st.success(tf('scan_complete',
                         success=results['cities_with_data'],
                         failed=21 - results['cities_with_data'],
                         duration=results['scan_time']
                     ))
 
                     if results.get('violations'):
-                        st.info(t('violations_auto_recorded').format(count=len(results['violations'])))
+                        st.info(tf('violations_auto_recorded', count=len(results['violations'])))
 
                     st.rerun()
 
             with col2:
                 stale_count = len(scanner.get_stale_cities(max_age_hours=6))
                 if stale_count > 0:
-                    st.warning(t('stale_cities').format(count=stale_count))
+                    st.warning(tf('stale_cities', count=stale_count))
                 else:
                     st.success(t('all_cities_fresh'))
 
@@ -1602,7 +1612,7 @@ def main():
                         if recorder and recorder.use_firestore:
                             try:
                                 deleted = recorder.clear_all_violations()
-                                st.success(t('all_history_cleared').format(count=deleted))
+                                st.success(tf('all_history_cleared', count=deleted))
                                 st.session_state.confirm_clear_all = False
                                 st.rerun()
                             except Exception as e:
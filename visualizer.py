@@ -17,6 +17,7 @@ import numpy as np
 from typing import Dict, List, Optional
 import logging
 import config
+import factory_index
 import os
 import time
 
@@ -159,33 +160,30 @@ class MapVisualizer:
         if factories:
             factory_cluster = MarkerCluster(name='Factories').add_to(m)
             
+            # One marker per location: co-located facilities share a popup
+            groups = {}
             for factory in factories:
+                groups.setdefault(factory_index.coord_key(*factory['location']), []).append(factory)
+
+            for group in groups.values():
                 # Determine marker color based on likelihood
-                if factory.get('likely_upwind'):
+                if any(factory.get('likely_upwind') for factory in group):
                     color = 'red'
                     icon = 'industry'
-                    priority = 'HIGH PRIORITY'
                 else:
                     color = 'blue'
                     icon = 'building'
-                    priority = 'Lower Priority'
                 
                 popup_html = f"""
                 <div style='width: 250px'>
-                    <h4>{factory['name']}</h4>
-                    <b>Type:</b> {factory['type']}<br>
-                    <b>Emissions:</b> {', '.join(factory['emissions'])}<br>
-                    <b>Distance from hotspot:</b> {factory.get('distance_km', 'N/A'):.1f} km<br>
-                    <b>Upwind likelihood:</b> {priority}<br>
-                    <b>Confidence:</b> {factory.get('confidence', 0):.0f}%<br>
-                    <b>Source:</b> {factory.get('source', 'Unknown')}
+                    {'<hr>'.join(self._factory_popup_section(factory) for factory in group)}
                 </div>
                 """
                 
                 folium.Marker(
-                    location=factory['location'],
+                    location=group[0]['location'],
                     popup=folium.Popup(popup_html, max_width=300),
-                    tooltip=factory['name'],
+                    tooltip=', '.join(factory['name'] for factory in group),
                     icon=folium.Icon(color=color, icon=icon, prefix='fa')
                 ).add_to(factory_cluster)
         
@@ -244,6 +242,20 @@ class MapVisualizer:
         logger.info(f"Map created for {city} - {gas}")
         return m
     
+    @staticmethod
+    def _factory_popup_section(factory: Dict) -> str:
+        """Popup HTML describing one facility."""
+        priority = 'HIGH PRIORITY' if factory.get('likely_upwind') else 'Lower Priority'
+        return f"""
+                    <h4>{factory['name']}</h4>
+                    <b>Type:</b> {factory['type']}<br>
+                    <b>Emissions:</b> {', '.join(factory['emissions'])}<br>
+                    <b>Distance from hotspot:</b> {factory.get('distance_km', 'N/A'):.1f} km<br>
+                    <b>Upwind likelihood:</b> {priority}<br>
+                    <b>Confidence:</b> {factory.get('confidence', 0):.0f}%<br>
+                    <b>Source:</b> {factory.get('source', 'Unknown')}
+                    """
+
     def _add_wind_arrow(self, m: folium.Map, hotspot: Dict, wind_data: Dict):
         """Add wind direction arrow to map"""
         # Calculate arrow endpoint (5km in wind direction)